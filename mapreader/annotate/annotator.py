@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import csv
 import functools
 import hashlib
 import json
@@ -8,6 +9,8 @@ import random
 import string
 import warnings
 from ast import literal_eval
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from itertools import product
 from pathlib import Path
 
@@ -15,17 +18,72 @@ import ipywidgets as widgets
 import numpy as np
 import pandas as pd
 from IPython.display import clear_output, display
-from numpy import array_split
 from PIL import Image, ImageOps
 
 from ..load.loader import load_patches
 
 warnings.filterwarnings("ignore", category=UserWarning)
 
+# prime Pillow's core plugins once at import rather than on first open
+Image.preinit()
+
+# known extensions -> single-format hints, to skip Pillow's plugin scan
+_FORMAT_HINTS = {
+    ".png": "PNG",
+    ".jpg": "JPEG",
+    ".jpeg": "JPEG",
+    ".tif": "TIFF",
+    ".tiff": "TIFF",
+}
+
+
+def _open_image(image_path: str) -> Image.Image:
+    """Open an image, hinting the format from its extension when known."""
+    ext = os.path.splitext(str(image_path))[1].lower()
+    fmt = _FORMAT_HINTS.get(ext)
+    return Image.open(image_path, formats=[fmt] if fmt else None)
+
+
 _CENTER_LAYOUT = widgets.Layout(
     display="flex", flex_flow="column", align_items="center"
 )
 
+# lookup table mapping pixel value -> lightened pixel value, precomputed once
+# so dimming is a uint8 gather rather than float arithmetic per pixel
+_DIM_LUT = (
+    (256 - (256 - np.arange(256, dtype=np.int16)) * 0.4).clip(0, 255).astype(np.uint8)
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _load_context_tile(image_path: str, dim: bool = True) -> Image.Image:
+    """
+    Open (and optionally dim) a context tile.
+
+    Recently used tiles are cached, so navigating between adjacent patches
+    reuses already opened/dimmed neighbours instead of re-reading them from
+    disk.
+
+    Parameters
+    ----------
+    image_path : str
+        Path to the tile image.
+    dim : bool, optional
+        Whether to dim (lighten) the image, by default True
+
+    Returns
+    -------
+    PIL.Image.Image
+    """
+    im = _open_image(image_path)
+
+    # Dim (lighten) the image
+    if dim in [True, "True"]:
+        # PIL's point runs the lookup table in C on the native image buffer,
+        # avoiding a PIL -> NumPy -> PIL roundtrip
+        im = im.point(_DIM_LUT.tolist() * len(im.getbands()))
+    return im
+
 
 class Annotator:
     """
@@ -57,6 +115,10 @@ class Annotator:
         Whether to show context when loading patches, by default False
     auto_save : bool, optional
         Whether to automatically save annotations, by default True
+    save_format : str, optional
+        Format to use when saving annotations. Options: "csv", "feather" or
+        "parquet". By default "csv". The binary formats are considerably
+        faster to write and smaller on disk but require pyarrow.
     delimiter : str, optional
         Delimiter used in CSV files, by default ","
     sortby : str or None, optional
@@ -96,6 +158,17 @@ class Annotator:
         If labels provided are not in the form of a list
     """
 
+    #: Column dtypes passed to ``pd.read_csv`` to skip type inference.
+    #: Columns holding tuple/list strings stay ``object`` for ``_eval_df``.
+    _CSV_DTYPES = {
+        "image_path": "string",
+        "parent_id": "string",
+        "url": "string",
+        "shape": "object",
+        "pixel_bounds": "object",
+        "coordinates": "object",
+    }
+
     def __init__(
         self,
         patch_df: str | pd.DataFrame | None = None,
@@ -109,6 +182,7 @@ class Annotator:
         label_col: str = "label",
         show_context: bool = False,
         auto_save: bool = True,
+        save_format: str = "csv",
         delimiter: str = ",",
         sortby: str | None = None,
         ascending: bool = True,
@@ -123,13 +197,17 @@ class Annotator:
     ):
         if labels is None:
             labels = []
+        if save_format not in ("csv", "feather", "parquet"):
+            raise ValueError(
+                "[ERROR] ``save_format`` must be one of 'csv', 'feather' or 'parquet'."
+            )
         if patch_df is not None:
             if isinstance(patch_df, str):
                 if os.path.exists(patch_df):
-                    patch_df = pd.read_csv(
+                    patch_df = self._read_cached(
                         patch_df,
-                        index_col=0,
-                        sep=delimiter,
+                        delimiter=delimiter,
+                        required_columns=(patch_paths_col, "pixel_bounds"),
                     )
                 else:
                     raise FileNotFoundError(f"[ERROR] Could not find {patch_df}.")
@@ -142,11 +220,7 @@ class Annotator:
         if parent_df is not None:
             if isinstance(parent_df, str):
                 if os.path.exists(parent_df):
-                    parent_df = pd.read_csv(
-                        parent_df,
-                        index_col=0,
-                        sep=delimiter,
-                    )
+                    parent_df = self._read_cached(parent_df, delimiter=delimiter)
                 else:
                     raise FileNotFoundError(f"[ERROR] Could not find {parent_df}.")
             if not isinstance(parent_df, pd.DataFrame):
@@ -181,7 +255,9 @@ class Annotator:
 
         # Check for url column and add to patch dataframe
         if "url" in parent_df.columns:
-            patch_df = patch_df.join(parent_df["url"], on="parent_id")
+            # parent_df is small relative to patch_df, so a dict-backed map
+            # beats building a join index over the whole patch frame
+            patch_df["url"] = patch_df["parent_id"].map(parent_df["url"])
 
         # Add label column if not present
         if label_col not in patch_df.columns:
@@ -193,10 +269,6 @@ class Annotator:
                 f"[ERROR] Your DataFrame does not have the image paths column: {patch_paths_col}."
             )
 
-        image_list = json.dumps(
-            sorted(patch_df[patch_paths_col].to_list()), sort_keys=True
-        )
-
         # Set up annotations file
         if not username:
             username = "".join(
@@ -204,34 +276,22 @@ class Annotator:
             )
         if not task_name:
             task_name = "task"
-        id = hashlib.md5(image_list.encode("utf-8")).hexdigest()
-
-        annotations_file = task_name.replace(" ", "_") + f"_#{username}#-{id}.csv"
-        annotations_file = os.path.join(annotations_dir, annotations_file)
 
         # Ensure labels are of type list
         if not isinstance(labels, list):
             raise SyntaxError("[ERROR] Labels provided must be as a list")
 
-        # Ensure unique values in list
-        labels = sorted(set(labels), key=labels.index)
-
-        # Test for existing patch annotation file
-        if os.path.exists(annotations_file):
-            print("[INFO] Loading existing patch annotations.")
-            patch_df = self._load_annotations(
-                patch_df=patch_df,
-                annotations_file=annotations_file,
-                labels=labels,
-                label_col=label_col,
-                delimiter=delimiter,
-            )
+        # Ensure unique values in list, preserving order
+        labels = list(dict.fromkeys(labels))
 
         ## pixel_bounds = x0, y0, x1, y1
-        patch_df["min_x"] = patch_df["pixel_bounds"].apply(lambda x: x[0])
-        patch_df["min_y"] = patch_df["pixel_bounds"].apply(lambda x: x[1])
-        patch_df["max_x"] = patch_df["pixel_bounds"].apply(lambda x: x[2])
-        patch_df["max_y"] = patch_df["pixel_bounds"].apply(lambda x: x[3])
+        bounds = np.asarray(patch_df["pixel_bounds"].to_list(), dtype=np.int64).reshape(
+            -1, 4
+        )
+        patch_df["min_x"] = bounds[:, 0]
+        patch_df["min_y"] = bounds[:, 1]
+        patch_df["max_x"] = bounds[:, 2]
+        patch_df["max_y"] = bounds[:, 3]
 
         # Sort by sortby column if provided
         if isinstance(sortby, str):
@@ -248,16 +308,21 @@ class Annotator:
             self._sortby = None
             self._ascending = True
 
-        self.patch_df = patch_df
+        self._patch_df = patch_df
 
         self._labels = labels
         self.label_col = label_col
         self.patch_paths_col = patch_paths_col
-        self.annotations_file = annotations_file
         self.show_context = show_context
         self.auto_save = auto_save
+        self._save_format = save_format
+        self._csv_fh = None
+        self._csv_writer = None
+        self._needs_snapshot = False
         self.username = username
         self.task_name = task_name
+        self._delimiter = delimiter
+        self._annotations_dir = annotations_dir
 
         # set up for the annotator
         self._min_values = min_values or {}
@@ -271,6 +336,11 @@ class Annotator:
         self.surrounding = surrounding
         self.max_size = max_size
         self.resize_to = resize_to
+        self._parent_patch_size = {}
+
+        # bounded LRU cache of decoded (and resized) patch images
+        self._patch_img_cache = OrderedDict()
+        self._patch_img_cache_size = 64
 
         # set up buttons
         self._buttons = []
@@ -299,10 +369,102 @@ class Annotator:
 
         # Setup queue
         self._queue = []
+        self._queue_paths = np.array([], dtype=object)
+        self._queue_min_x = np.array([], dtype=np.int64)
+        self._queue_min_y = np.array([], dtype=np.int64)
+
+        # Finish the heavy part of setup (image-list hashing and merging any
+        # existing annotations) on a background thread so the notebook cell
+        # returns quickly; joined on first access via ``_ensure_loaded``.
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._load_future = executor.submit(self._load, patch_df)
+        executor.shutdown(wait=False)
 
     def __len__(self):
         return len(self.patch_df)
 
+    def _load(self, patch_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Finish the heavy part of initialization: hash the image list to
+        derive the annotations file name and merge any existing annotations.
+
+        Runs on a background thread started in ``__init__``; use
+        ``_ensure_loaded`` to wait for the result.
+
+        Parameters
+        ----------
+        patch_df : pd.DataFrame
+            The validated patch DataFrame.
+
+        Returns
+        -------
+        pd.DataFrame
+            The patch DataFrame with any existing annotations merged in.
+        """
+        # hash the sorted image paths, streaming bytes straight into the
+        # hasher instead of building an intermediate JSON string
+        sorted_paths = sorted(patch_df[self.patch_paths_col].to_list())
+        hasher = hashlib.md5()
+        for image_path in sorted_paths:
+            hasher.update(image_path.encode("utf-8"))
+            hasher.update(b"\0")
+        id = hasher.hexdigest()
+
+        file_stem = self.task_name.replace(" ", "_") + f"_#{self.username}#"
+        self._annotations_file = os.path.join(
+            self._annotations_dir, f"{file_stem}-{id}.{self._save_format}"
+        )
+
+        # Test for existing patch annotation file
+        annotations_file = self._annotations_file
+        if not os.path.exists(annotations_file):
+            # earlier versions hashed a JSON dump of the sorted paths and
+            # always saved as csv - fall back to that name so existing
+            # annotation files keep loading
+            legacy_id = hashlib.md5(
+                json.dumps(sorted_paths, sort_keys=True).encode("utf-8")
+            ).hexdigest()
+            legacy_file = os.path.join(
+                self._annotations_dir, f"{file_stem}-{legacy_id}.csv"
+            )
+            if os.path.exists(legacy_file):
+                annotations_file = legacy_file
+                if self._save_format == "csv":
+                    # keep appending to the legacy file; for the binary
+                    # formats the next auto-save snapshots the merged
+                    # annotations into the new-style file instead
+                    self._annotations_file = legacy_file
+
+        if os.path.exists(annotations_file):
+            print("[INFO] Loading existing patch annotations.")
+            patch_df, needs_rewrite = self._load_annotations(
+                patch_df=patch_df,
+                annotations_file=annotations_file,
+                labels=self._labels,
+                label_col=self.label_col,
+                delimiter=self._delimiter,
+            )
+            if needs_rewrite:
+                self._needs_snapshot = True
+
+        return patch_df
+
+    def _ensure_loaded(self) -> None:
+        """Wait for the background initialization started in ``__init__``."""
+        if self._load_future is not None:
+            self._patch_df = self._load_future.result()
+            self._load_future = None
+
+    @property
+    def patch_df(self) -> pd.DataFrame:
+        self._ensure_loaded()
+        return self._patch_df
+
+    @property
+    def annotations_file(self) -> str:
+        self._ensure_loaded()
+        return self._annotations_file
+
     @staticmethod
     def _load_dataframes(
         patch_paths: str | None = None,
@@ -350,9 +512,111 @@ class Annotator:
 
         return parent_df, patch_df
 
+    @classmethod
+    def _read_cached(
+        cls,
+        path: str,
+        delimiter: str = ",",
+        required_columns: tuple = (),
+    ) -> pd.DataFrame:
+        """
+        Read a CSV file, using a Feather sidecar file as a cache.
+
+        If a ``<path>.feather`` file exists and is newer than the CSV, it is
+        loaded instead, skipping both CSV parsing and tuple/list evaluation.
+        Otherwise the CSV is read, evaluated and the sidecar (re)written.
+
+        The sidecar does not record which delimiter produced it, so caching
+        is skipped entirely for non-default delimiters. A sidecar is only
+        written (or trusted) if the frame contains ``required_columns``, so
+        a mis-parsed CSV is never cached. Caching is also skipped silently
+        if pyarrow is not installed.
+
+        Parameters
+        ----------
+        path : str
+            Path to the CSV file.
+        delimiter : str, optional
+            Delimiter used in the CSV file, by default ","
+        required_columns : tuple, optional
+            Columns the frame must contain for the sidecar to be read or
+            written, by default ()
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        use_cache = delimiter == ","
+        cache_path = f"{path}.feather"
+        if (
+            use_cache
+            and os.path.exists(cache_path)
+            and os.path.getmtime(cache_path) >= os.path.getmtime(path)
+        ):
+            try:
+                df = pd.read_feather(cache_path)
+                df = df.set_index(df.columns[0])
+                if df.index.name == "index":
+                    df.index.name = None
+                # feather stores tuple-valued columns as arrays
+                for col in df.columns:
+                    if (
+                        df[col].dtype == object
+                        and len(df)
+                        and isinstance(df[col].iloc[0], (list, np.ndarray))
+                    ):
+                        df[col] = df[col].map(tuple)
+                if all(col in df.columns for col in required_columns):
+                    return df
+            except (ImportError, OSError, ValueError):
+                pass
+
+        df = pd.read_csv(
+            path,
+            index_col=0,
+            sep=delimiter,
+            dtype=cls._CSV_DTYPES,
+            engine="c",
+            low_memory=False,
+        )
+        df = cls._eval_df(df)
+        if use_cache and all(col in df.columns for col in required_columns):
+            try:
+                df.reset_index().to_feather(cache_path)
+            except (ImportError, OSError, ValueError):
+                pass
+        return df
+
     @staticmethod
     def _eval_df(df):
         for col in df.columns:
+            if len(df) == 0 or df[col].dtype != object:
+                continue
+
+            sample = df[col].iloc[0]
+            if not isinstance(sample, str) or not sample.startswith(("(", "[")):
+                continue
+
+            # the fast path only preserves element types for flat sequences -
+            # inner tuples would come back as lists - so nested values go
+            # through literal_eval
+            if not any(char in sample[1:] for char in "(["):
+                try:
+                    # fast path: tuple/list-like strings are valid JSON after
+                    # swapping parentheses for brackets
+                    as_json = (
+                        df[col]
+                        .str.replace("(", "[", regex=False)
+                        .str.replace(")", "]", regex=False)
+                    )
+                    parsed = as_json.map(json.loads)
+                    if sample.startswith("("):
+                        parsed = parsed.map(tuple)
+                    df[col] = parsed
+                    continue
+                except (ValueError, TypeError):
+                    pass
+
             try:
                 df[col] = df[col].apply(literal_eval)
             except (ValueError, TypeError, SyntaxError):
@@ -382,29 +646,78 @@ class Annotator:
         delimiter : str
             Delimiter used in CSV files
 
+        Returns
+        -------
+        tuple[pd.DataFrame, bool]
+            The patch dataframe with existing annotations merged in, and
+            whether the file needs rewriting as a full snapshot before any
+            rows are appended to it (i.e. it used the legacy int-label
+            format).
         """
-        existing_annotations = pd.read_csv(annotations_file, index_col=0, sep=delimiter)
+        if annotations_file.endswith(".feather"):
+            existing_annotations = pd.read_feather(annotations_file)
+            existing_annotations = existing_annotations.set_index(
+                existing_annotations.columns[0]
+            )
+        elif annotations_file.endswith(".parquet"):
+            existing_annotations = pd.read_parquet(annotations_file)
+        else:
+            # only the index and label columns are merged, so skip parsing the rest
+            skip_cols = {"pixel_bounds", "parent_id", "image_path"}
+            existing_annotations = pd.read_csv(
+                annotations_file,
+                index_col=0,
+                sep=delimiter,
+                usecols=lambda col: col not in skip_cols,
+                engine="c",
+                low_memory=False,
+            )
 
         if label_col not in existing_annotations.columns:
             raise ValueError(
                 f"[ERROR] Your existing annotations do not have the label column: {label_col}."
             )
 
+        # append-mode auto-save may have written a row more than once (e.g.
+        # after re-labelling) - keep the most recent entry per row
+        if not existing_annotations.index.is_unique:
+            existing_annotations = existing_annotations[
+                ~existing_annotations.index.duplicated(keep="last")
+            ]
+
+        needs_rewrite = False
         if existing_annotations[label_col].dtype == int:
             # convert label indices (ints) to labels (strings)
             # this is to convert old annotations format to new annotations format
-            existing_annotations[label_col] = existing_annotations[label_col].apply(
-                lambda x: labels[x]
-            )
+            existing_annotations[label_col] = np.asarray(labels, dtype=object)[
+                existing_annotations[label_col].to_numpy(dtype=np.int64)
+            ]
+            # appending string labels to the int-labelled file would leave a
+            # mixed column behind, so it must be rewritten in full first
+            needs_rewrite = True
 
-        patch_df = patch_df.join(
-            existing_annotations[label_col], how="left", rsuffix="_existing"
-        )
-        if f"{label_col}_existing" in patch_df.columns:
-            patch_df[label_col].fillna(patch_df[f"{label_col}_existing"], inplace=True)
-            patch_df.drop(columns=f"{label_col}_existing", inplace=True)
+        if (
+            existing_annotations.index.is_unique
+            and existing_annotations.index.isin(patch_df.index).all()
+        ):
+            # fast path: every annotated row is present in patch_df, so
+            # assign labels in place instead of allocating suffixed columns
+            existing_labels = existing_annotations[label_col]
+            current_labels = patch_df.loc[existing_labels.index, label_col]
+            patch_df.loc[existing_labels.index, label_col] = current_labels.fillna(
+                existing_labels
+            )
+        else:
+            patch_df = patch_df.join(
+                existing_annotations[label_col], how="left", rsuffix="_existing"
+            )
+            if f"{label_col}_existing" in patch_df.columns:
+                patch_df[label_col].fillna(
+                    patch_df[f"{label_col}_existing"], inplace=True
+                )
+                patch_df.drop(columns=f"{label_col}_existing", inplace=True)
 
-        return patch_df
+        return patch_df, needs_rewrite
 
     def _setup_buttons(self) -> None:
         """
@@ -424,6 +737,8 @@ class Annotator:
             btn.on_click(functools.partial(on_click, label))
             self._buttons.append(btn)
 
+        self._button_by_label = {btn.description: btn for btn in self._buttons}
+
     def _setup_box(self) -> None:
         """
         Set up the box which holds all the buttons.
@@ -472,46 +787,26 @@ class Annotator:
             pd.Index object, or a pd.Series of legible rows.
         """
 
-        def check_eligibility(row):
-            if row.label not in [np.NaN, None]:
-                return False
-
-            if self._filter_for is None:
-                test = [
-                    row[col] >= min_value for col, min_value in self._min_values.items()
-                ] + [
-                    row[col] <= max_value for col, max_value in self._max_values.items()
-                ]
-            else:
-                test = (
-                    [
-                        row[col] >= min_value
-                        for col, min_value in self._min_values.items()
-                    ]
-                    + [
-                        row[col] <= max_value
-                        for col, max_value in self._max_values.items()
-                    ]
-                    + [
-                        row[col] == filter_for
-                        for col, filter_for in self._filter_for.items()
-                    ]
-                )
-
-            if not all(test):
-                return False
+        # boolean-mask selections below already return new frames, so no
+        # deep copy of the full patch DataFrame is needed
+        queue_df = self.patch_df[self.patch_df[self.label_col].isna()]
 
-            return True
+        # build one boolean mask from the min/max/filter constraints
+        eligible = np.ones(len(queue_df), dtype=bool)
+        for col, min_value in self._min_values.items():
+            eligible &= (queue_df[col] >= min_value).to_numpy()
+        for col, max_value in self._max_values.items():
+            eligible &= (queue_df[col] <= max_value).to_numpy()
+        if self._filter_for is not None:
+            for col, filter_for in self._filter_for.items():
+                eligible &= (queue_df[col] == filter_for).to_numpy()
 
-        queue_df = self.patch_df.copy(deep=True)
-        queue_df = queue_df[queue_df[self.label_col].isna()]  # only unlabelled
-        queue_df["eligible"] = queue_df.apply(check_eligibility, axis=1)
+        queue_df = queue_df[eligible]
 
         if self._sortby is not None:
-            queue_df.sort_values(self._sortby, ascending=self._ascending, inplace=True)
-            queue_df = queue_df[queue_df.eligible]
+            queue_df = queue_df.sort_values(self._sortby, ascending=self._ascending)
         else:
-            queue_df = queue_df[queue_df.eligible].sample(frac=1)  # shuffle
+            queue_df = queue_df.sample(frac=1)  # shuffle
 
         indices = queue_df.index
         if as_type == "list":
@@ -520,6 +815,20 @@ class Annotator:
             return indices
         return queue_df
 
+    def _update_queue(self) -> None:
+        """
+        Rebuild the annotation queue along with parallel lookup arrays, so
+        per-example access in ``render``/``get_context`` is plain array
+        indexing rather than repeated pandas scalar lookups.
+        """
+        self._queue = self.get_queue()
+        queue_index = pd.Index(self._queue)
+        self._queue_paths = (
+            self.patch_df[self.patch_paths_col].reindex(queue_index).to_numpy()
+        )
+        self._queue_min_x = self.patch_df["min_x"].reindex(queue_index).to_numpy()
+        self._queue_min_y = self.patch_df["min_y"].reindex(queue_index).to_numpy()
+
     def get_context(self):
         """
         Provides the surrounding context for the patch to be annotated.
@@ -531,17 +840,6 @@ class Annotator:
             context.
         """
 
-        def get_path(image_path, dim=True):
-            # Resize the image
-            im = Image.open(image_path)
-
-            # Dim the image
-            if dim in [True, "True"]:
-                im_array = np.array(im)
-                im_array = 256 - (256 - im_array) * 0.4  # lighten image
-                im = Image.fromarray(im_array.astype(np.uint8))
-            return im
-
         def get_empty_square(patch_size: tuple[int, int]):
             """Generates an empty square image.
 
@@ -566,20 +864,26 @@ class Annotator:
 
         ix = self._queue[self.current_index]
 
-        min_x = self.patch_df.at[ix, "min_x"]
-        min_y = self.patch_df.at[ix, "min_y"]
+        min_x = self._queue_min_x[self.current_index]
+        min_y = self._queue_min_y[self.current_index]
+
+        current_parent = self.patch_df.at[ix, "parent_id"]
 
         # cannot assume all patches are same size
         try:
             height, width, _ = self.patch_df.at[ix, "shape"]
         except KeyError:
-            im_path = self.patch_df.at[ix, self.patch_paths_col]
-            im = Image.open(im_path)
-            height = im.height
-            width = im.width
+            # only open one patch per parent to read dimensions
+            if current_parent in self._parent_patch_size:
+                height, width = self._parent_patch_size[current_parent]
+            else:
+                im_path = self.patch_df.at[ix, self.patch_paths_col]
+                with Image.open(im_path) as im:
+                    height = im.height
+                    width = im.width
+                self._parent_patch_size[current_parent] = (height, width)
 
-        current_parent = self.patch_df.at[ix, "parent_id"]
-        parent_frame = self.patch_df.query(f"parent_id=='{current_parent}'")
+        parent_frame = self.patch_df[self.patch_df["parent_id"] == current_parent]
 
         deltas = list(range(-self.surrounding, self.surrounding + 1))
         y_and_x = list(
@@ -588,53 +892,68 @@ class Annotator:
                 [min_x + x_delta * width for x_delta in deltas],
             )
         )
-        queries = [f"min_x == {x} & min_y == {y}" for y, x in y_and_x]
-        items = [parent_frame.query(query) for query in queries]
 
-        # derive ids from items
-        ids = [x.index[0] if len(x.index) == 1 else None for x in items]
-        ids = [x != ix for x in ids]
+        # look up all neighbours with a single (min_x, min_y) index lookup
+        # instead of one query scan per neighbour
+        lookup = pd.DataFrame(
+            {
+                "image_path": parent_frame["image_path"].to_numpy(),
+                "image_id": parent_frame.index.to_numpy(),
+            },
+            index=pd.MultiIndex.from_frame(parent_frame[["min_x", "min_y"]]),
+        )
+        if not lookup.index.is_unique:
+            lookup = lookup[~lookup.index.duplicated(keep=False)]
+        found = lookup.reindex([(x, y) for y, x in y_and_x])
+
+        # derive ids from found rows (missing neighbours are NaN)
+        ids = [neighbour_ix != ix for neighbour_ix in found["image_id"]]
 
-        # derive images from items
+        # derive images from found rows
         image_paths = [
-            x.at[x.index[0], "image_path"] if len(x.index) == 1 else None for x in items
+            image_path if isinstance(image_path, str) else None
+            for image_path in found["image_path"]
         ]
 
         # zip them
         image_list = list(zip(image_paths, ids))
 
+        # load the tiles in parallel - image decoding releases the GIL
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tiles = list(
+                executor.map(
+                    lambda x: _load_context_tile(x[0], dim=bool(x[1]))
+                    if x[0]
+                    else get_empty_square((width, height)),
+                    image_list,
+                )
+            )
+
         # split them into rows
         per_row = len(deltas)
-        images = [
-            [
-                get_path(x[0], dim=x[1]) if x[0] else get_empty_square((width, height))
-                for x in lst
-            ]
-            for lst in array_split(image_list, per_row)
-        ]
+        images = [tiles[i : i + per_row] for i in range(0, len(tiles), per_row)]
 
         total_width = (2 * self.surrounding + 1) * width
         total_height = (2 * self.surrounding + 1) * height
 
-        context_image = Image.new("RGB", (total_width, total_height))
-
-        y_offset = 0
-        for row in images:
-            x_offset = 0
-            for image in row:
-                context_image.paste(image, (x_offset, y_offset))
-                x_offset += width
-            y_offset += height
-
+        # paste the tiles into a preallocated array - slice assignment is a
+        # straight memcpy, avoiding per-tile PIL paste dispatch
+        canvas = np.zeros((total_height, total_width, 3), dtype=np.uint8)
+        for row_ix, row in enumerate(images):
+            for col_ix, image in enumerate(row):
+                tile = np.asarray(image.convert("RGB"))[:height, :width]
+                canvas[
+                    row_ix * height : row_ix * height + tile.shape[0],
+                    col_ix * width : col_ix * width + tile.shape[1],
+                ] = tile
+        context_image = Image.fromarray(canvas)
+
+        # thumbnail resizes in place, avoiding a second full-size buffer
         if self.resize_to is not None:
-            context_image = ImageOps.contain(
-                context_image, (self.resize_to, self.resize_to)
-            )
+            context_image.thumbnail((self.resize_to, self.resize_to))
         # only constrain to max size if not resize_to
         elif max(context_image.size) > self.max_size:
-            context_image = ImageOps.contain(
-                context_image, (self.max_size, self.max_size)
-            )
+            context_image.thumbnail((self.max_size, self.max_size))
 
         return context_image
 
@@ -693,7 +1012,7 @@ class Annotator:
             self._max_values = max_values
 
         # re-set up queue using new min/max values
-        self._queue = self.get_queue()
+        self._update_queue()
 
         self._annotate(
             show_context=show_context,
@@ -742,15 +1061,35 @@ class Annotator:
             self.max_size = max_size
 
         # re-set up queue
-        self._queue = self.get_queue()
+        self._update_queue()
 
         if self._filter_for is not None:
             print(f"[INFO] Filtering for: {self._filter_for}")
 
         self.out = widgets.Output(layout=_CENTER_LAYOUT)
+
+        # persistent footer widgets - render() mutates these in place, so each
+        # step sends a small value update over the comms channel instead of
+        # serializing freshly constructed widgets
+        self._url_html = widgets.HTML("")
+        self._progress = widgets.IntProgress(
+            value=0,
+            min=0,
+            max=len(self._queue),
+            step=1,
+            description="",
+            orientation="horizontal",
+            barstyle="success",
+        )
+        self._footer = widgets.VBox(
+            [self._url_html, self._progress],
+            layout=_CENTER_LAYOUT,
+        )
+
         display(self.box)
         display(self.navbox)
         display(self.out)
+        display(self._footer)
 
         # self.get_current_index()
         # TODO: Does not pick the correct NEXT...
@@ -772,9 +1111,7 @@ class Annotator:
         self.previous_index = self.current_index
         self.current_index += 1
 
-        ix = self._queue[self.current_index]
-
-        img_path = self.patch_df.at[ix, self.patch_paths_col]
+        img_path = self._queue_paths[self.current_index]
 
         self.render()
         return self.previous_index, self.current_index, img_path
@@ -796,9 +1133,7 @@ class Annotator:
             self.previous_index = self.current_index
             self.current_index -= 1
 
-        ix = self._queue[self.current_index]
-
-        img_path = self.patch_df.at[ix, self.patch_paths_col]
+        img_path = self._queue_paths[self.current_index]
 
         self.render()
         return self.previous_index, self.current_index, img_path
@@ -821,19 +1156,13 @@ class Annotator:
 
         ix = self._queue[self.current_index]
 
-        # render buttons
-        for button in self._buttons:
-            if button.description == "prev":
-                # disable previous button when at first example
-                button.disabled = self.current_index <= 0
-            elif button.description == "next":
-                # disable skip button when at last example
-                button.disabled = self.current_index >= len(self) - 1
-            elif button.description != "submit":
-                if self.patch_df.at[ix, self.label_col] == button.description:
-                    button.icon = "check"
-                else:
-                    button.icon = ""
+        # render buttons, only touching icons which actually change so no-op
+        # widget updates don't trigger comm round-trips
+        current_label = self.patch_df.at[ix, self.label_col]
+        for label, button in self._button_by_label.items():
+            icon = "check" if label == current_label else ""
+            if button.icon != icon:
+                button.icon = icon
 
         # display new example
         with self.out:
@@ -845,31 +1174,25 @@ class Annotator:
                 display(context.convert("RGB"))
             else:
                 display(image.convert("RGB"))
-            add_ins = []
-            if "url" in self.patch_df.loc[ix].keys():
-                url = self.patch_df.at[ix, "url"]
-                text = f'<p><a href="{url}" target="_blank">Click to see entire map.</a></p>'
-                add_ins += [widgets.HTML(text)]
-
-            value = self.current_index + 1 if self.current_index else 1
-            description = f"{value} / {len(self._queue)}"
-            add_ins += [
-                widgets.IntProgress(
-                    value=value,
-                    min=0,
-                    max=len(self._queue),
-                    step=1,
-                    description=description,
-                    orientation="horizontal",
-                    barstyle="success",
-                )
-            ]
-            display(
-                widgets.VBox(
-                    add_ins,
-                    layout=_CENTER_LAYOUT,
-                )
+
+        # update the persistent footer in place, only touching traitlets whose
+        # values actually change
+        if "url" in self.patch_df.loc[ix].keys():
+            url = self.patch_df.at[ix, "url"]
+            text = (
+                f'<p><a href="{url}" target="_blank">Click to see entire map.</a></p>'
             )
+        else:
+            text = ""
+        if self._url_html.value != text:
+            self._url_html.value = text
+
+        value = self.current_index + 1 if self.current_index else 1
+        description = f"{value} / {len(self._queue)}"
+        if self._progress.value != value:
+            self._progress.value = value
+        if self._progress.description != description:
+            self._progress.description = description
 
     def get_patch_image(self, ix) -> Image:
         """
@@ -885,14 +1208,32 @@ class Annotator:
         PIL.Image
             A PIL.Image object of the image at the given index.
         """
+        cache_key = (ix, self.resize_to, self.max_size)
+        image = self._patch_img_cache.get(cache_key)
+        if image is not None:
+            self._patch_img_cache.move_to_end(cache_key)
+            return image
+
         image_path = self.patch_df.at[ix, self.patch_paths_col]
-        image = Image.open(image_path)
+        image = _open_image(image_path)
 
         if self.resize_to is not None:
-            image = ImageOps.contain(image, (self.resize_to, self.resize_to))
+            target_size = self.resize_to
         # only constrain to max size if not resize_to
         elif max(image.size) > self.max_size:
-            image = ImageOps.contain(image, (self.max_size, self.max_size))
+            target_size = self.max_size
+        else:
+            target_size = None
+
+        if target_size is not None:
+            # for JPEG sources, draft decodes at reduced resolution (1/2,
+            # 1/4, 1/8) straight from the codec; a no-op for other formats
+            image.draft("RGB", (target_size, target_size))
+            image = ImageOps.contain(image, (target_size, target_size))
+
+        self._patch_img_cache[cache_key] = image
+        if len(self._patch_img_cache) > self._patch_img_cache_size:
+            self._patch_img_cache.popitem(last=False)
 
         return image
 
@@ -913,18 +1254,88 @@ class Annotator:
         ix = self._queue[self.current_index]
         self.patch_df.at[ix, self.label_col] = annotation
         if self.auto_save:
-            self._auto_save()
+            self._auto_save(ix)
         self._next_example()
 
-    def _auto_save(self):
+    def _auto_save(self, ix=None):
         """
         Automatically saves the annotations made so far.
 
+        If ``ix`` is given, only that newly annotated row is appended to the
+        annotations file; otherwise the full (sorted) annotations are
+        rewritten as a clean snapshot.
+
+        Parameters
+        ----------
+        ix : int | str | None, optional
+            The index of the newly annotated row, by default None
+
         Returns
         -------
         None
         """
-        self.get_labelled_data(sort=True).to_csv(self.annotations_file)
+        self._ensure_loaded()
+
+        # incremental appends are only possible for csv, and a legacy-format
+        # file must be rewritten in full once before rows are appended to it
+        if ix is not None and self._save_format == "csv" and not self._needs_snapshot:
+            self._append_annotation(ix)
+            return
+
+        # close the append handle before rewriting the full snapshot
+        if self._csv_fh is not None:
+            self._csv_fh.close()
+            self._csv_fh = None
+            self._csv_writer = None
+
+        labelled_df = self.get_labelled_data(sort=True)
+        if self._save_format == "feather":
+            labelled_df.reset_index().to_feather(self.annotations_file)
+        elif self._save_format == "parquet":
+            labelled_df.to_parquet(self.annotations_file)
+        else:
+            labelled_df.to_csv(self.annotations_file)
+        self._needs_snapshot = False
+
+    def _append_annotation(self, ix) -> None:
+        """
+        Append a single annotated row to the annotations file, rather than
+        rewriting the whole file on every annotation.
+
+        Re-labelled rows are simply appended again; ``_load_annotations``
+        keeps the last entry per row when reloading.
+
+        Parameters
+        ----------
+        ix : int | str
+            The index of the newly annotated row.
+        """
+        if self._csv_fh is None:
+            is_new = not os.path.exists(self.annotations_file)
+            self._csv_fh = open(self.annotations_file, "a", newline="")
+            self._csv_writer = csv.writer(self._csv_fh)
+            if is_new:
+                self._csv_writer.writerow(
+                    [
+                        "",
+                        self.label_col,
+                        self.patch_paths_col,
+                        "parent_id",
+                        "pixel_bounds",
+                    ]
+                )
+
+        row = self.patch_df.loc[ix]
+        self._csv_writer.writerow(
+            [
+                ix,
+                row[self.label_col],
+                row[self.patch_paths_col],
+                row["parent_id"],
+                row["pixel_bounds"],
+            ]
+        )
+        self._csv_fh.flush()
 
     def get_labelled_data(
         self,
@@ -954,9 +1365,21 @@ class Annotator:
             A dataframe containing the labelled images and their associated
             label index.
         """
-        filtered_df = self.patch_df[self.patch_df[self.label_col].notna()].copy(
-            deep=True
-        )
+        return_cols = [
+            self.label_col,
+            self.patch_paths_col,
+            "parent_id",
+            "pixel_bounds",
+        ]
+
+        # copy only the returned columns (plus the sort keys), rather than
+        # deep-copying the full patch DataFrame
+        select_cols = return_cols + ["min_x", "min_y"]
+        if "image_id" in self.patch_df.columns:
+            select_cols = ["image_id"] + select_cols
+
+        mask = self.patch_df[self.label_col].notna()
+        filtered_df = self.patch_df.loc[mask, select_cols].copy()
 
         # force image_id to be index (incase of integer index)
         # TODO: Force all indices to be integers so this is not needed
@@ -966,16 +1389,25 @@ class Annotator:
             filtered_df.set_index("image_id", drop=True, inplace=True)
 
         if sort:
-            filtered_df.sort_values(by=["parent_id", "min_x", "min_y"], inplace=True)
+            # order rows with a single stable argsort over the key arrays
+            # (primary key last) instead of a multi-column sort_values
+            order = np.lexsort(
+                (
+                    filtered_df["min_y"].to_numpy(),
+                    filtered_df["min_x"].to_numpy(),
+                    filtered_df["parent_id"].to_numpy(),
+                )
+            )
+            filtered_df = filtered_df.iloc[order]
 
         if index_labels:
-            filtered_df[self.label_col] = filtered_df[self.label_col].apply(
-                lambda x: self._labels.index(x)
+            # map through a precomputed dict instead of list.index per row
+            label_to_index = {label: i for i, label in enumerate(self._labels)}
+            filtered_df[self.label_col] = filtered_df[self.label_col].map(
+                label_to_index
             )
 
-        return filtered_df[
-            [self.label_col, self.patch_paths_col, "parent_id", "pixel_bounds"]
-        ]
+        return filtered_df[return_cols]
 
     @property
     def filtered(self) -> pd.DataFrame:
@@ -23,6 +23,7 @@ except ImportError:
 
 import matplotlib.patches as patches
 import matplotlib.pyplot as plt
+import shapely
 from PIL import Image
 from shapely import LineString, Polygon
 
@@ -419,22 +420,37 @@ class DeepSoloRunner:
             else:
                 raise ValueError("[ERROR] Please provide a `patch_df`")
 
-        for image_id, prediction in self.patch_predictions.items():
-            parent_id = patch_df.loc[image_id, "parent_id"]
-            if parent_id not in self.parent_predictions.keys():
-                self.parent_predictions[parent_id] = []
-
-            for instance in prediction:
-                polygon = instance[0]
+        # materialize plain dict lookups once instead of per-row .loc access
+        parent_id_map = patch_df["parent_id"].to_dict()
+        bounds_map = patch_df["pixel_bounds"].to_dict()
 
-                xx, yy = (np.array(i) for i in polygon.exterior.xy)
-                xx = xx + patch_df.loc[image_id, "pixel_bounds"][0]  # add min_x
-                yy = yy + patch_df.loc[image_id, "pixel_bounds"][1]  # add min_y
+        for image_id, prediction in self.patch_predictions.items():
+            parent_id = parent_id_map[image_id]
+            parent_instances = self.parent_predictions.setdefault(parent_id, [])
+
+            if not prediction:
+                continue
+
+            # patches at the parent origin need no shift - reuse the patch
+            # polygons as-is instead of copying every geometry
+            min_x, min_y = bounds_map[image_id][:2]
+            if min_x == 0 and min_y == 0:
+                parent_instances.extend(list(instance) for instance in prediction)
+                continue
+
+            # shift all polygons for this patch with one vectorized
+            # coordinate transform instead of rebuilding each polygon
+            parent_polygons = shapely.transform(
+                [instance[0] for instance in prediction],
+                lambda coords, min_x=min_x, min_y=min_y: np.add(
+                    coords, (min_x, min_y), out=coords
+                ),
+            )
 
-                parent_polygon = Polygon(zip(xx, yy))
-                self.parent_predictions[parent_id].append(
-                    [parent_polygon, instance[1], instance[2]]
-                )
+            parent_instances.extend(
+                [parent_polygon, *instance[1:]]
+                for instance, parent_polygon in zip(prediction, parent_polygons)
+            )
 
         if return_dataframe:
             return self._dict_to_dataframe(self.parent_predictions, geo=False)
@@ -474,29 +490,45 @@ class DeepSoloRunner:
             print("[INFO] Converting patch pixel bounds to parent pixel bounds.")
             _ = self.convert_to_parent_pixel_bounds()
 
+        # materialize plain dict lookups once instead of per-row .loc access
+        parent_map = parent_df[["dlon", "dlat", "coordinates", "crs"]].to_dict("index")
+
         for parent_id, prediction in self.parent_predictions.items():
-            if parent_id not in self.geo_predictions.keys():
+            if parent_id not in self.geo_predictions:
                 self.geo_predictions[parent_id] = []
 
-                for instance in prediction:
-                    polygon = instance[0]
-
-                    xx, yy = (np.array(i) for i in polygon.exterior.xy)
-                    xx = (
-                        xx * parent_df.loc[parent_id, "dlon"]
-                        + parent_df.loc[parent_id, "coordinates"][0]
-                    )
-                    yy = (
-                        parent_df.loc[parent_id, "coordinates"][3]
-                        - yy * parent_df.loc[parent_id, "dlat"]
-                    )
-
-                    crs = parent_df.loc[parent_id, "crs"]
+                if not prediction:
+                    continue
+
+                parent_info = parent_map[parent_id]
+                dlon = parent_info["dlon"]
+                dlat = parent_info["dlat"]
+                min_lon = parent_info["coordinates"][0]
+                max_lat = parent_info["coordinates"][3]
+                crs = parent_info["crs"]
+
+                def _to_geo(
+                    coords, dlon=dlon, min_lon=min_lon, dlat=dlat, max_lat=max_lat
+                ):
+                    # shapely.transform hands us a fresh copy of the
+                    # coordinates, so the fused multiply-add can run in place
+                    # without allocating temporaries per polygon
+                    coords[:, 0] *= dlon
+                    coords[:, 0] += min_lon
+                    coords[:, 1] *= -dlat
+                    coords[:, 1] += max_lat
+                    return coords
+
+                # convert all polygons for this parent with one vectorized
+                # coordinate transform instead of rebuilding each polygon
+                geo_polygons = shapely.transform(
+                    [instance[0] for instance in prediction], _to_geo
+                )
 
-                    parent_polygon_geo = Polygon(zip(xx, yy))
-                    self.geo_predictions[parent_id].append(
-                        [parent_polygon_geo, crs, instance[1], instance[2]]
-                    )
+                self.geo_predictions[parent_id].extend(
+                    [geo_polygon, crs, *instance[1:]]
+                    for instance, geo_polygon in zip(prediction, geo_polygons)
+                )
 
         if return_dataframe:
             return self._dict_to_dataframe(self.geo_predictions, geo=True)
@@ -526,15 +558,17 @@ class DeepSoloRunner:
         else:
             columns = ["polygon", "text", "score"]
 
-        preds_df = pd.concat(
-            pd.DataFrame(
-                preds[k],
-                index=np.full(len(preds[k]), k),
-                columns=columns,
-            )
-            for k in preds.keys()
-        )
-        preds_df.index.name = "image_id"
+        # flatten predictions into one list of rows plus parallel keys and
+        # build the DataFrame in a single allocation, instead of building one
+        # frame per image and concatenating
+        keys = []
+        rows = []
+        for k, v in preds.items():
+            keys.extend([k] * len(v))
+            rows.extend(v)
+
+        preds_df = pd.DataFrame(rows, columns=columns)
+        preds_df.index = pd.Index(keys, name="image_id")
         preds_df.reset_index(inplace=True)  # reset index to get image_id as a column
         return preds_df
 
@@ -596,11 +630,11 @@ class DeepSoloRunner:
             If the image ID is not found in the patch or parent predictions.
         """
 
-        if image_id in self.patch_predictions.keys():
+        if image_id in self.patch_predictions:
             preds = self.patch_predictions
             image_path = self.patch_df.loc[image_id, "image_path"]
 
-        elif image_id in self.parent_predictions.keys():
+        elif image_id in self.parent_predictions:
             preds = self.parent_predictions
             image_path = self.parent_df.loc[image_id, "image_path"]
 
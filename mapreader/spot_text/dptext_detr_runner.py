@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import inspect
 import os
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import adet
@@ -13,6 +15,7 @@ except ImportError:
 import geopandas as geopd
 import numpy as np
 import pandas as pd
+import torch
 from adet.config import get_cfg
 
 try:
@@ -22,8 +25,9 @@ except ImportError:
 
 import matplotlib.patches as patches
 import matplotlib.pyplot as plt
+import shapely
 from PIL import Image
-from shapely import Polygon
+from torchvision.io import ImageReadMode, decode_jpeg, read_file
 
 # first assert we are using the dptext detr version of adet
 if adet.__version__ != "0.2.0-dptext-detr":
@@ -31,6 +35,30 @@ if adet.__version__ != "0.2.0-dptext-detr":
         "Please install DPText-DETR from the following link: https://github.com/rwood-97/DPText-DETR"
     )
 
+# prime Pillow's core plugins once at import rather than on first open
+Image.preinit()
+
+# known extensions -> single-format hints, to skip Pillow's plugin scan
+_FORMAT_HINTS = {
+    ".png": "PNG",
+    ".jpg": "JPEG",
+    ".jpeg": "JPEG",
+    ".tif": "TIFF",
+    ".tiff": "TIFF",
+}
+
+
+def _open_image(img_path: str | pathlib.Path) -> Image.Image:
+    """Open an image, hinting the format from its extension when known."""
+    ext = os.path.splitext(str(img_path))[1].lower()
+    fmt = _FORMAT_HINTS.get(ext)
+    return Image.open(img_path, formats=[fmt] if fmt else None)
+
+
+# decoding JPEGs on the GPU needs the ``device`` argument, which torchvision
+# versions at the lower end of our declared range do not have
+_GPU_JPEG_DECODE = "device" in inspect.signature(decode_jpeg).parameters
+
 
 class DPTextDETRRunner:
     def __init__(
@@ -67,6 +95,7 @@ class DPTextDETRRunner:
         self,
         patch_df: pd.DataFrame = None,
         return_dataframe: bool = False,
+        batch_size: int = 4,
     ) -> dict | pd.DataFrame:
         """Run the model on all images in the patch dataframe.
 
@@ -76,6 +105,8 @@ class DPTextDETRRunner:
             Dataframe containing patch information, by default None.
         return_dataframe : bool, optional
             Whether to return the predictions as a pandas DataFrame, by default False
+        batch_size : int, optional
+            Number of images to run through the model at once, by default 4
 
         Returns
         -------
@@ -90,16 +121,62 @@ class DPTextDETRRunner:
         img_paths = patch_df["image_path"].to_list()
 
         patch_predictions = self.run_on_images(
-            img_paths, return_dataframe=return_dataframe
+            img_paths, return_dataframe=return_dataframe, batch_size=batch_size
         )
         return patch_predictions
 
+    def _prepare_image(self, img_path: str | pathlib.Path) -> dict:
+        """Load an image and preprocess it into a model input dict.
+
+        Applies the same format conversion and resize transform as
+        ``DefaultPredictor.__call__``. On CUDA devices, JPEGs are decoded
+        directly on the GPU with nvJPEG and resized there, skipping the
+        host-side decode and host-to-device copy.
+        """
+        device = self.predictor.cfg.MODEL.DEVICE
+        ext = os.path.splitext(str(img_path))[1].lower()
+
+        if (
+            _GPU_JPEG_DECODE
+            and str(device).startswith("cuda")
+            and ext in (".jpg", ".jpeg")
+        ):
+            data = read_file(str(img_path))
+            image = decode_jpeg(data, mode=ImageReadMode.RGB, device=device)
+            if self.predictor.input_format == "RGB":
+                image = image.flip(0)  # model expects BGR
+            height, width = image.shape[1:]
+            aug = self.predictor.aug
+            new_h, new_w = aug.get_output_shape(
+                height, width, aug.short_edge_length[0], aug.max_size
+            )
+            image = torch.nn.functional.interpolate(
+                image[None].to(torch.float32),
+                size=(new_h, new_w),
+                mode="bilinear",
+                align_corners=False,
+                antialias=True,
+            )[0]
+            return {"image": image, "height": height, "width": width}
+
+        img = _open_image(img_path).convert("RGB")
+        img_array = np.array(img)
+
+        if self.predictor.input_format == "RGB":
+            img_array = img_array[:, :, ::-1]
+        height, width = img_array.shape[:2]
+        image = self.predictor.aug.get_transform(img_array).apply_image(img_array)
+        image = torch.as_tensor(image.astype("float32").transpose(2, 0, 1))
+
+        return {"image": image, "height": height, "width": width}
+
     def run_on_images(
         self,
         img_paths: str | pathlib.Path | list,
         return_dataframe: bool = False,
+        batch_size: int = 4,
     ) -> dict | pd.DataFrame:
-        """Run the model on a list of images.
+        """Run the model on a list of images, batching inference.
 
         Parameters
         ----------
@@ -107,6 +184,8 @@ class DPTextDETRRunner:
             A list of image paths to run the model on.
         return_dataframe : bool, optional
             Whether to return the predictions as a pandas DataFrame, by default False
+        batch_size : int, optional
+            Number of images to run through the model at once, by default 4
 
         Returns
         -------
@@ -117,8 +196,41 @@ class DPTextDETRRunner:
         if isinstance(img_paths, (str, pathlib.Path)):
             img_paths = [img_paths]
 
-        for img_path in img_paths:
-            _ = self.run_on_image(img_path, return_outputs=False)
+        # run the model on batches of images rather than one forward pass per
+        # image - detectron2 models accept a list of input dicts
+        batches = [
+            img_paths[i : i + batch_size] for i in range(0, len(img_paths), batch_size)
+        ]
+
+        def _prepare_batch(batch_paths):
+            return [self._prepare_image(img_path) for img_path in batch_paths]
+
+        # decode/preprocess the next batch in a background thread while the
+        # model runs on the current one, so throughput is bounded by
+        # max(decode, infer) rather than their sum
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            prefetched = (
+                executor.submit(_prepare_batch, batches[0]) if batches else None
+            )
+
+            for i, batch_paths in enumerate(batches):
+                batch_inputs = prefetched.result()
+                if i + 1 < len(batches):
+                    prefetched = executor.submit(_prepare_batch, batches[i + 1])
+
+                with torch.inference_mode():
+                    batch_outputs = self.predictor.model(batch_inputs)
+
+                for img_path, outputs in zip(batch_paths, batch_outputs):
+                    outputs["image_id"] = os.path.basename(img_path)
+                    outputs["img_path"] = img_path
+                    self.get_patch_predictions(outputs)
+
+                # periodically return freed blocks to the driver so peak
+                # memory stays bounded on multi-thousand-image runs
+                del batch_inputs, batch_outputs
+                if torch.cuda.is_available() and i % 16 == 0:
+                    torch.cuda.empty_cache()
 
         if return_dataframe:
             return self._dict_to_dataframe(self.patch_predictions, geo=False)
@@ -147,13 +259,25 @@ class DPTextDETRRunner:
             The predictions for the image or the outputs from the model if `return_outputs` is True.
         """
         # load image
-        img = Image.open(img_path).convert("RGB")
-        img_array = np.array(img)
+        img = _open_image(img_path)
+
+        # for oversize JPEGs, let libjpeg decode at reduced resolution - the
+        # predictor's resize would throw the extra pixels away anyway; keep
+        # the scale so predictions can be mapped back to the full resolution
+        scale = (1.0, 1.0)
+        max_edge = self.predictor.cfg.INPUT.MAX_SIZE_TEST
+        if img.format == "JPEG" and max(img.size) > max_edge:
+            orig_width, orig_height = img.size
+            img.draft("RGB", (max_edge, max_edge))
+            scale = (orig_width / img.size[0], orig_height / img.size[1])
+
+        img_array = np.array(img.convert("RGB"))
 
         # run inference
         outputs = self.predictor(img_array)
         outputs["image_id"] = os.path.basename(img_path)
         outputs["img_path"] = img_path
+        outputs["scale"] = scale
 
         if return_outputs:
             return outputs
@@ -191,24 +315,42 @@ class DPTextDETRRunner:
         instances = outputs["instances"].to("cpu")
         scores = instances.scores.tolist()
         pred_classes = instances.pred_classes.tolist()
-        bd_pts = np.asarray(instances.polygons)
+        # extract the polygon control points as one contiguous array rather
+        # than coercing a list of per-detection arrays into an object ndarray
+        polygons = instances.polygons
+        if isinstance(polygons, torch.Tensor):
+            bd_pts = polygons.numpy()
+        else:
+            bd_pts = np.asarray(polygons)
 
-        self._post_process(image_id, scores, pred_classes, bd_pts)
+        # drop the per-image Instances tensors now that the fields we need
+        # have been extracted - keeping them alive bloats memory over long runs
+        del instances
+        outputs.pop("instances", None)
+
+        self._post_process(image_id, scores, pred_classes, bd_pts, outputs.get("scale"))
 
         if return_dataframe:
             return self._dict_to_dataframe(self.patch_predictions, geo=False)
         return self.patch_predictions
 
-    def _post_process(self, image_id, scores, pred_classes, bd_pnts):
-        for score, _pred_class, bd in zip(scores, pred_classes, bd_pnts):
-            # draw polygons
-            if bd is not None:
-                bd = bd.reshape(-1, 2)
-                polygon = Polygon(bd)
-
-            score = f"{score:.2f}"
-
-            self.patch_predictions[image_id].append([polygon, score])
+    def _post_process(self, image_id, scores, pred_classes, bd_pnts, scale=None):
+        if len(bd_pnts) == 0:
+            return
+
+        # build all polygons with one vectorized GEOS call instead of one
+        # Polygon() per detection
+        pts = np.asarray(bd_pnts, dtype=np.float64).reshape(len(bd_pnts), -1, 2)
+        if scale is not None and scale != (1.0, 1.0):
+            # image was decoded at reduced resolution - map the points back
+            # into the full-resolution pixel space
+            pts *= scale
+        polygons = shapely.polygons(pts)
+        scores = [f"{score:.2f}" for score in scores]
+
+        self.patch_predictions[image_id].extend(
+            [polygon, score] for polygon, score in zip(polygons, scores)
+        )
 
     def convert_to_parent_pixel_bounds(
         self,
@@ -240,20 +382,37 @@ class DPTextDETRRunner:
             else:
                 raise ValueError("[ERROR] Please provide a `patch_df`")
 
-        for image_id, prediction in self.patch_predictions.items():
-            parent_id = patch_df.loc[image_id, "parent_id"]
-            if parent_id not in self.parent_predictions.keys():
-                self.parent_predictions[parent_id] = []
-
-            for instance in prediction:
-                polygon = instance[0]
+        # materialize plain dict lookups once instead of per-row .loc access
+        parent_id_map = patch_df["parent_id"].to_dict()
+        bounds_map = patch_df["pixel_bounds"].to_dict()
 
-                xx, yy = (np.array(i) for i in polygon.exterior.xy)
-                xx = xx + patch_df.loc[image_id, "pixel_bounds"][0]  # add min_x
-                yy = yy + patch_df.loc[image_id, "pixel_bounds"][1]  # add min_y
+        for image_id, prediction in self.patch_predictions.items():
+            parent_id = parent_id_map[image_id]
+            parent_instances = self.parent_predictions.setdefault(parent_id, [])
+
+            if not prediction:
+                continue
+
+            # patches at the parent origin need no shift - reuse the patch
+            # polygons as-is instead of copying every geometry
+            min_x, min_y = bounds_map[image_id][:2]
+            if min_x == 0 and min_y == 0:
+                parent_instances.extend(list(instance) for instance in prediction)
+                continue
+
+            # shift all polygons for this patch with one vectorized
+            # coordinate transform instead of rebuilding each polygon
+            parent_polygons = shapely.transform(
+                [instance[0] for instance in prediction],
+                lambda coords, min_x=min_x, min_y=min_y: np.add(
+                    coords, (min_x, min_y), out=coords
+                ),
+            )
 
-                parent_polygon = Polygon(zip(xx, yy))
-                self.parent_predictions[parent_id].append([parent_polygon, instance[1]])
+            parent_instances.extend(
+                [parent_polygon, *instance[1:]]
+                for instance, parent_polygon in zip(prediction, parent_polygons)
+            )
 
         if return_dataframe:
             return self._dict_to_dataframe(self.parent_predictions, geo=False)
@@ -293,29 +452,45 @@ class DPTextDETRRunner:
             print("[INFO] Converting patch pixel bounds to parent pixel bounds.")
             _ = self.convert_to_parent_pixel_bounds()
 
+        # materialize plain dict lookups once instead of per-row .loc access
+        parent_map = parent_df[["dlon", "dlat", "coordinates", "crs"]].to_dict("index")
+
         for parent_id, prediction in self.parent_predictions.items():
-            if parent_id not in self.geo_predictions.keys():
+            if parent_id not in self.geo_predictions:
                 self.geo_predictions[parent_id] = []
 
-                for instance in prediction:
-                    polygon = instance[0]
-
-                    xx, yy = (np.array(i) for i in polygon.exterior.xy)
-                    xx = (
-                        xx * parent_df.loc[parent_id, "dlon"]
-                        + parent_df.loc[parent_id, "coordinates"][0]
-                    )
-                    yy = (
-                        parent_df.loc[parent_id, "coordinates"][3]
-                        - yy * parent_df.loc[parent_id, "dlat"]
-                    )
-
-                    crs = parent_df.loc[parent_id, "crs"]
-
-                    parent_polygon_geo = Polygon(zip(xx, yy))
-                    self.geo_predictions[parent_id].append(
-                        [parent_polygon_geo, crs, instance[1]]
-                    )
+                if not prediction:
+                    continue
+
+                parent_info = parent_map[parent_id]
+                dlon = parent_info["dlon"]
+                dlat = parent_info["dlat"]
+                min_lon = parent_info["coordinates"][0]
+                max_lat = parent_info["coordinates"][3]
+                crs = parent_info["crs"]
+
+                def _to_geo(
+                    coords, dlon=dlon, min_lon=min_lon, dlat=dlat, max_lat=max_lat
+                ):
+                    # shapely.transform hands us a fresh copy of the
+                    # coordinates, so the fused multiply-add can run in place
+                    # without allocating temporaries per polygon
+                    coords[:, 0] *= dlon
+                    coords[:, 0] += min_lon
+                    coords[:, 1] *= -dlat
+                    coords[:, 1] += max_lat
+                    return coords
+
+                # convert all polygons for this parent with one vectorized
+                # coordinate transform instead of rebuilding each polygon
+                geo_polygons = shapely.transform(
+                    [instance[0] for instance in prediction], _to_geo
+                )
+
+                self.geo_predictions[parent_id].extend(
+                    [geo_polygon, crs, *instance[1:]]
+                    for instance, geo_polygon in zip(prediction, geo_polygons)
+                )
 
         if return_dataframe:
             return self._dict_to_dataframe(self.geo_predictions, geo=True)
@@ -345,15 +520,17 @@ class DPTextDETRRunner:
         else:
             columns = ["polygon", "score"]
 
-        preds_df = pd.concat(
-            pd.DataFrame(
-                preds[k],
-                index=np.full(len(preds[k]), k),
-                columns=columns,
-            )
-            for k in preds.keys()
-        )
-        preds_df.index.name = "image_id"
+        # flatten predictions into one list of rows plus parallel keys and
+        # build the DataFrame in a single allocation, instead of building one
+        # frame per image and concatenating
+        keys = []
+        rows = []
+        for k, v in preds.items():
+            keys.extend([k] * len(v))
+            rows.extend(v)
+
+        preds_df = pd.DataFrame(rows, columns=columns)
+        preds_df.index = pd.Index(keys, name="image_id")
         preds_df.reset_index(inplace=True)
         return preds_df
 
@@ -387,11 +564,11 @@ class DPTextDETRRunner:
         image_width_resolution: int | None = None,
         return_fig: bool = False,
     ) -> None:
-        if image_id in self.patch_predictions.keys():
+        if image_id in self.patch_predictions:
             preds = self.patch_predictions
             image_path = self.patch_df.loc[image_id, "image_path"]
 
-        elif image_id in self.parent_predictions.keys():
+        elif image_id in self.parent_predictions:
             preds = self.parent_predictions
             image_path = self.parent_df.loc[image_id, "image_path"]
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
 from mapreader import Annotator, loader
@@ -51,6 +53,36 @@ def test_init_with_csvs(load_dfs):
     assert isinstance(annotator.patch_df.iloc[0]["coordinates"], tuple)
 
 
+def test_csv_feather_sidecar(load_dfs):
+    pytest.importorskip("pyarrow")
+    _, _, tmp_path = load_dfs
+    csv_path = f"{tmp_path}/patch_df.csv"
+    kwargs = {
+        "parent_df": f"{tmp_path}/parent_df.csv",
+        "labels": ["a", "b"],
+        "annotations_dir": f"{tmp_path}/annotations/",
+        "auto_save": False,
+    }
+
+    # cold read parses the CSV and writes the sidecar
+    annotator = Annotator(patch_df=csv_path, **kwargs)
+    sidecar = Path(f"{csv_path}.feather")
+    assert sidecar.exists()
+    assert len(annotator) == 9
+
+    # warm read loads from the sidecar, keeping tuple-valued columns
+    annotator = Annotator(patch_df=csv_path, **kwargs)
+    assert len(annotator) == 9
+    assert isinstance(annotator.patch_df.iloc[0]["coordinates"], tuple)
+
+    # a CSV newer than its sidecar invalidates it
+    patch_df = pd.read_csv(csv_path, index_col=0)
+    patch_df.iloc[:8].to_csv(csv_path)
+    os.utime(csv_path, (os.path.getmtime(sidecar) + 10,) * 2)
+    annotator = Annotator(patch_df=csv_path, **kwargs)
+    assert len(annotator) == 8
+
+
 def test_init_with_fpaths(load_dfs, sample_dir):
     _, _, tmp_path = load_dfs
     annotator = Annotator(
@@ -189,6 +221,56 @@ def test_filter_for(load_dfs):
     assert queue[-1] == "patch-6-0-9-3-#cropped_74488689.png#.png"
 
 
+def test_auto_save_append_reload(load_dfs):
+    _, _, tmp_path = load_dfs
+    kwargs = {
+        "patch_df": f"{tmp_path}/patch_df.csv",
+        "parent_df": f"{tmp_path}/parent_df.csv",
+        "labels": ["a", "b"],
+        "annotations_dir": f"{tmp_path}/annotations/",
+        "username": "rosie",
+        "task_name": "test",
+    }
+    annotator = Annotator(**kwargs)
+    annotator._update_queue()
+    ix = annotator._queue[0]
+    annotator.patch_df.at[ix, annotator.label_col] = "a"
+    annotator._auto_save(ix)
+    assert os.path.exists(annotator.annotations_file)
+
+    # re-labelling appends another row; the last entry wins on reload
+    annotator.patch_df.at[ix, annotator.label_col] = "b"
+    annotator._auto_save(ix)
+
+    annotator = Annotator(**kwargs)
+    assert annotator.patch_df.at[ix, annotator.label_col] == "b"
+
+
+@pytest.mark.parametrize("save_format", ["feather", "parquet"])
+def test_auto_save_binary_formats(load_dfs, save_format):
+    pytest.importorskip("pyarrow")
+    _, _, tmp_path = load_dfs
+    kwargs = {
+        "patch_df": f"{tmp_path}/patch_df.csv",
+        "parent_df": f"{tmp_path}/parent_df.csv",
+        "labels": ["a", "b"],
+        "annotations_dir": f"{tmp_path}/annotations/",
+        "username": "rosie",
+        "task_name": "test",
+        "save_format": save_format,
+    }
+    annotator = Annotator(**kwargs)
+    annotator._update_queue()
+    ix = annotator._queue[0]
+    annotator.patch_df.at[ix, annotator.label_col] = "a"
+    annotator._auto_save(ix)
+    assert annotator.annotations_file.endswith(f".{save_format}")
+    assert os.path.exists(annotator.annotations_file)
+
+    annotator = Annotator(**kwargs)
+    assert annotator.patch_df.at[ix, annotator.label_col] == "a"
+
+
 # errors
 
 
@@ -216,6 +298,26 @@ def test_incorrect_delimiter(load_dfs):
         )
 
 
+def test_incorrect_delimiter_does_not_poison_cache(load_dfs):
+    _, _, tmp_path = load_dfs
+    with pytest.raises(ValueError):
+        Annotator(
+            patch_df=f"{tmp_path}/patch_df.csv",
+            parent_df=f"{tmp_path}/parent_df.csv",
+            delimiter="|",
+        )
+    # the failed parse must not leave a sidecar behind that breaks
+    # subsequent reads with the correct delimiter
+    annotator = Annotator(
+        patch_df=f"{tmp_path}/patch_df.csv",
+        parent_df=f"{tmp_path}/parent_df.csv",
+        labels=["a", "b"],
+        annotations_dir=f"{tmp_path}/annotations/",
+        auto_save=False,
+    )
+    assert len(annotator) == 9
+
+
 def test_init_dfs_value_error(load_dfs):
     with pytest.raises(ValueError, match="path to a csv or a pandas DataFrame"):
         Annotator(
@@ -256,6 +358,16 @@ def test_sortby_value_errors(load_dfs):
         )
 
 
+def test_invalid_save_format(load_dfs):
+    parent_df, patch_df, _ = load_dfs
+    with pytest.raises(ValueError, match="save_format"):
+        Annotator(
+            patch_df=patch_df,
+            parent_df=parent_df,
+            save_format="json",
+        )
+
+
 def test_fpaths_metadata_filenotfound_error(load_dfs, sample_dir):
     _, _, tmp_path = load_dfs
     with pytest.raises(FileNotFoundError):